@@ -0,0 +1,145 @@
+from Board import Board
+from itertools import islice
+from multiprocessing import Pool
+import argparse
+import os
+import sys
+import time
+
+
+# puzzles with known answers covering a unique solution, a 17 hint puzzle, multiple solutions,
+# no solution, conflicting hints, and a line that is not a puzzle, which pin Board.solve
+KNOWN_PUZZLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "known_puzzles.txt")
+
+
+def solve_puzzle(line):
+    """
+    Solves the puzzle on the given line and checks that its solution is unique
+    :param line: a string holding an 81 character puzzle as accepted by Board.from_puzzle
+    :return: a tuple (puzzle, solution, status, seconds) where status is "unique", "multiple", "none",
+             or "invalid", solution is "-" unless the puzzle has a solution, and seconds is the time
+             taken to solve the puzzle
+             Note: The puzzle of an invalid line has its whitespace replaced by _ so it stays one field
+    """
+    start = time.perf_counter()
+    puzzle = line.strip()
+    try:
+        board = Board.from_puzzle(puzzle)
+
+    # the line is not a puzzle
+    except ValueError:
+        return "_".join(puzzle.split()), "-", "invalid", time.perf_counter() - start
+
+    num_solutions = board.solve()
+    status = ["none", "unique", "multiple"][num_solutions]
+    solution = board.get_solution() if num_solutions > 0 else "-"
+    return puzzle, solution, status, time.perf_counter() - start
+
+
+class BatchSolver:
+    """
+    BatchSolver class for solving a stream of puzzles across a pool of processes, storing the following info:
+    - the number of processes to spread the puzzles over
+    - the number of puzzles handed to a process at a time
+    """
+
+    def __init__(self, processes=None, chunksize=64):
+        """
+        Creates a BatchSolver object with the processes and chunksize attributes
+        :param processes: the number of worker processes, or None for one per CPU
+        :param chunksize: the number of puzzles handed to a worker at a time
+        """
+        self.__processes = processes
+        self.__chunksize = chunksize
+
+    def run(self, lines, output):
+        """
+        Solves the puzzle on each non-blank line and writes a "puzzle solution status milliseconds" line
+        to the output for each one, in the same order as the input
+        Note: Lines are read a batch at a time, so the whole input never has to fit in memory
+        :param lines: an iterable of strings, such as an open file or sys.stdin
+        :param output: a writable file
+        :return: a dictionary with the number of puzzles, the number of each status, the total seconds,
+                 and the puzzles solved per second
+        """
+        stats = {"puzzles": 0, "unique": 0, "multiple": 0, "none": 0, "invalid": 0}
+        start = time.perf_counter()
+        puzzles = (line for line in lines if line.strip())
+
+        with Pool(self.__processes) as pool:
+            batch_size = self.__chunksize * 4 * (self.__processes or os.cpu_count() or 1)
+            batch = list(islice(puzzles, batch_size))
+            while batch:
+                for puzzle, solution, status, seconds in pool.imap(solve_puzzle, batch, self.__chunksize):
+                    output.write("%s %s %s %.3f\n" % (puzzle, solution, status, seconds * 1000))
+                    stats["puzzles"] += 1
+                    stats[status] += 1
+                batch = list(islice(puzzles, batch_size))
+
+        stats["seconds"] = time.perf_counter() - start
+        stats["puzzles_per_second"] = stats["puzzles"] / stats["seconds"] if stats["seconds"] > 0 else 0.0
+        return stats
+
+    def check_puzzles(self, path=KNOWN_PUZZLES_PATH):
+        """
+        Solves each puzzle in the given file and compares the result against the expected one
+        :param path: a string naming a file with one "puzzle status solution" line per puzzle, where status
+                     is as returned by solve_puzzle and solution is - for no solution or * to accept any,
+                     the known puzzles committed with the repository by default
+        :return: a tuple (puzzle, expected, actual) of the first puzzle whose status or solution is not the
+                 expected one, where expected and actual are "status solution" strings, or None if all match
+        """
+        with open(path) as file:
+            lines = [line.split() for line in file if line.strip()]
+
+        with Pool(self.__processes) as pool:
+            for (puzzle, status, solution), (_, actual_solution, actual_status, _) in \
+                    zip(lines, pool.imap(solve_puzzle, [line[0] for line in lines])):
+                if actual_status != status or (solution != "*" and actual_solution != solution):
+                    return puzzle, "%s %s" % (status, solution), "%s %s" % (actual_status, actual_solution)
+        return None
+
+
+def main():
+    """
+    Solves puzzles from a file or standard input from the command line, for example:
+        python Batch.py puzzles.txt --output results.txt
+        cat puzzles.txt | python Batch.py > results.txt
+        python Batch.py --check
+    """
+    parser = argparse.ArgumentParser(description="Solve puzzles one per line and check their solutions are unique")
+    parser.add_argument("input", nargs="?", default="-", help="file of puzzles, or - for standard input")
+    parser.add_argument("--output", default="-", help="file for results, or - for standard output")
+    parser.add_argument("--processes", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--check", nargs="?", const=KNOWN_PUZZLES_PATH, metavar="PATH",
+                        help="instead of solving, check the solver against puzzles with known answers, "
+                             "the committed ones if no file is given")
+    args = parser.parse_args()
+
+    if args.check is not None:
+        mismatch = BatchSolver(args.processes).check_puzzles(args.check)
+        if mismatch is None:
+            print("all puzzles solved as expected")
+        else:
+            print("puzzle %s: expected %s, got %s" % mismatch)
+            raise SystemExit(1)
+        return
+
+    lines = sys.stdin if args.input == "-" else open(args.input)
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        stats = BatchSolver(args.processes).run(lines, output)
+    finally:
+        if lines is not sys.stdin:
+            lines.close()
+        if output is not sys.stdout:
+            output.close()
+
+    # report the totals separately from the results so they can still be piped
+    print("%d puzzles (%d unique, %d multiple, %d none, %d invalid) in %.2f s, %.1f puzzles/s"
+          % (stats["puzzles"], stats["unique"], stats["multiple"], stats["none"], stats["invalid"],
+             stats["seconds"], stats["puzzles_per_second"]), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
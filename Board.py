@@ -1,5 +1,6 @@
 import numpy as np
 import random
+import time
 from Cell import Cell
 
 
@@ -20,12 +21,28 @@ class Board:
                       [6, 4, 5, 9, 7, 8, 3, 1, 2],
                       [9, 7, 8, 3, 1, 2, 6, 4, 5]]
 
-    def __init__(self, rand_seed):
+    # number of allowed numbers in each bit mask used by __search, looked up rather than counted
+    __bit_counts = [bin(mask).count("1") for mask in range(0, 1024)]
+
+    # most cells __fill_random guesses in before starting over - a fill usually takes about 56 guesses
+    # and over 99% finish within 80, so starting over caps the worst fills at a few times a typical one
+    fill_max_nodes = 80
+
+    def __init__(self, rand_seed, deadline=None, random_fill=False):
         """
-        Creates a Board object with the cells and num_solutions attributes
+        Creates a Board object with the cells and truncated attributes
         :param rand_seed: seed with which to create the board - allows the same board to be generated
                                                                 multiple times by identifying its seed
+        :param deadline: None to remove hints for as long as it takes, or a number of seconds after which
+                         to stop removing hints and keep the puzzle with the fewest hints found so far
+        :param random_fill: False to shuffle the starting board template, or True to fill an empty board
+                            with a random search so that any solved board can be generated
+                            Note: The two give different boards for the same seed
         """
+        # the time at which hints must stop being removed
+        stop_time = None if deadline is None else time.monotonic() + deadline
+        self.__truncated = False
+
         # sets the seed for random numbers to be generated the same way for the same seed
         random.seed(rand_seed)
 
@@ -39,12 +56,17 @@ class Board:
                 self.cells[i, j] = Cell()
                 self.cells[i, j].set_correct(self.starting_board[i][j])
 
+        # replace the template with a randomly searched solved board
+        if random_fill:
+            self.__fill_random()
+
         # randomly shuffle the board so that the correct attributes no longer match up with
         # the template values
-        self.__shuffle_all()
+        else:
+            self.__shuffle_all()
 
         # decide which cells should be hints given to the player
-        self.__make_hints()
+        self.__make_hints(stop_time)
 
     def __swap_nums(self, num1, num2):
         """
@@ -162,6 +184,32 @@ class Board:
         self.__shuffle_rows()
         self.__shuffle_nums()
 
+    def __fill_random(self, max_nodes=None):
+        """
+        Sets the correct numbers of the board to a random solved board
+            Works by filling the three blocks on the diagonal with random orderings of [1, 9], since they
+            share no rows or columns, then filling the rest with __search guessing numbers in a random order
+            If the search takes more than max_nodes guesses it starts over with new diagonal blocks, which
+            are drawn from the same seeded random numbers, so the board is still the same for the same seed
+        :param max_nodes: a positive integer - the most cells to guess in before starting over, or None to
+                          use fill_max_nodes as it is when the board is filled
+        """
+        if max_nodes is None:
+            max_nodes = self.fill_max_nodes
+        solution = None
+        while solution is None:
+            grid = [0] * 81
+            for block in range(0, 3):
+                nums = random.sample(range(1, 10), 9)
+                for k in range(0, 9):
+                    grid[(block * 3 + k // 3) * 9 + block * 3 + k % 3] = nums[k]
+
+            # any filling of the diagonal blocks can be completed, so only giving up leaves no solution
+            solution = self.__search(grid, limit=1, shuffle=True, max_nodes=max_nodes)[1]
+        for i in range(0, 9):
+            for j in range(0, 9):
+                self.cells[i][j].set_correct(solution[i * 9 + j])
+
     def __check_row_allowed(self, r, c, num):
         """
         Checks the rest of the given row (r) to see if the given number (num)
@@ -395,16 +443,40 @@ class Board:
 
         return num_solutions
 
-    def __make_hints(self):
+    def __make_hints(self, stop_time=None):
+        """
+        Removes random hints until the board has multiple solutions, then adds back the last hint removed
+        Note: With a stop time, solutions are counted with __search, which counts the same as __backtrack
+              but much faster, so a board that is not truncated is the same as one made without a stop time
+        :param stop_time: None, or the time.monotonic() value after which to stop removing hints and
+                          keep the last board that was checked to have one solution
+        """
 
         # board starts with all cells being hints so there is only one possible solution
         unique_solution = True
 
+        # no hint has been removed without checking the board still has one solution
+        unchecked = False
+
         # remove hints until multiple solutions then add back the last hint removed
         while unique_solution:
 
+            # out of time, so keep the fewest hints that were checked to have one solution
+            if stop_time is not None and time.monotonic() > stop_time:
+                unique_solution = False
+                self.__truncated = True
+
+                # restore the hint taken away since the last check
+                if unchecked:
+                    self.cells[i][j].set_is_hint(True)
+
+                # set all guesses to None, as no guesses by the user have been made
+                for i in range(0, 9):
+                    for j in range(0, 9):
+                        self.cells[i][j].set_guess(None)
+
             # board has one solution with current hints
-            if self.__backtrack() == 1:
+            elif (self.__backtrack() if stop_time is None else self.__search(self.__hint_grid())[0]) == 1:
 
                 # choose a random hint to take away
                 i = random.randrange(0, 9)
@@ -413,6 +485,7 @@ class Board:
                     i = random.randrange(0, 9)
                     j = random.randrange(0, 9)
                 self.cells[i][j].set_is_hint(False)
+                unchecked = True
 
             # board has more than one solution with current hints
             else:
@@ -428,4 +501,196 @@ class Board:
                     for j in range(0, 9):
                         self.cells[i][j].set_guess(None)
 
-a = Board(12)
\ No newline at end of file
+    @classmethod
+    def from_puzzle(cls, puzzle):
+        """
+        Creates a Board object from an existing puzzle instead of generating one from a seed
+        Note: The correct numbers of the cells that are not hints are 0 until the board is solved
+        :param puzzle: a string of 81 characters read row by row, with digits in [1, 9] for hints and
+                       0 or . for blanks, or a 9x9 array of integers in [0, 9] with 0 or None for blanks
+        :return: a Board object whose hints are the given numbers
+        """
+
+        # flatten the puzzle into a list of 81 integers with 0 for blanks
+        if isinstance(puzzle, str):
+            puzzle = puzzle.strip().replace(".", "0")
+            if len(puzzle) != 81 or not all(ch in "0123456789" for ch in puzzle):
+                raise ValueError("puzzle must be 81 characters of digits and .")
+            nums = [int(ch) for ch in puzzle]
+        else:
+            puzzle = np.asarray(puzzle, dtype=object)
+            if puzzle.shape != (9, 9):
+                raise ValueError("puzzle must be a 9x9 array of integers in [0, 9]")
+            nums = [0 if num is None else num for num in puzzle.flatten()]
+
+            # floats and booleans compare equal to integers but would not print as digits
+            if not all(isinstance(num, (int, np.integer)) and not isinstance(num, (bool, np.bool_))
+                       and 0 <= num <= 9 for num in nums):
+                raise ValueError("puzzle must be a 9x9 array of integers in [0, 9]")
+            nums = [int(num) for num in nums]
+
+        # make the board without generating one from a seed
+        board = cls.__new__(cls)
+        board.__truncated = False
+        board.cells = np.empty([9, 9], dtype=Cell)
+        for i in range(0, 9):
+            for j in range(0, 9):
+                board.cells[i, j] = Cell()
+                board.cells[i, j].set_correct(nums[i * 9 + j])
+                board.cells[i, j].set_is_hint(nums[i * 9 + j] != 0)
+                board.cells[i, j].set_guess(None)
+        return board
+
+    def solve(self):
+        """
+        Solves the board based off of only the hints the board currently has and sets the correct
+        numbers of the cells that are not hints to the first solution found
+        Note: Unlike __backtrack, this does not require the board to have a solution
+        :return: the integer 0 if the board has no solution, 1 if the board has only one possible solution,
+                 or 2 if the board has multiple possible solutions
+        """
+        num_solutions, solution = self.__search(self.__hint_grid())
+
+        # fill in the correct numbers from the first solution
+        if num_solutions > 0:
+            for i in range(0, 9):
+                for j in range(0, 9):
+                    self.cells[i][j].set_correct(solution[i * 9 + j])
+        return num_solutions
+
+    def __hint_grid(self):
+        """
+        Returns the hints of the board read row by row
+        :return: a list of 81 integers in [0, 9], with 0 for each cell that is not a hint
+        """
+        return [self.cells[i][j].get_correct() if self.cells[i][j].get_is_hint() else 0
+                for i in range(0, 9) for j in range(0, 9)]
+
+    @staticmethod
+    def __search(grid, limit=2, shuffle=False, max_nodes=None):
+        """
+        Counts the solutions of the given grid, stopping at the given limit
+            Works by keeping the numbers used in each row, column, and block as bits of an integer,
+            then always guessing in the empty cell with the fewest allowed numbers, which is far
+            faster than __backtrack on puzzles with few hints
+        :param grid: a list of 81 integers in [0, 9] read row by row, with 0 for blanks
+        :param limit: a positive integer - the number of solutions after which to stop searching
+        :param shuffle: True to guess the allowed numbers of a cell in a random order, False to guess
+                        them from smallest to largest
+        :param max_nodes: None to search for as long as it takes, or the most cells to guess in before
+                          giving up
+        :return: a tuple (num_solutions, solution) where num_solutions is in [0, limit], or None if the search
+                 gave up, and solution is a list of 81 integers for the first solution found, or None if
+                 there is none
+        """
+        rows = [0] * 9
+        cols = [0] * 9
+        blocks = [0] * 9
+        empty = []
+
+        # record the numbers used by the hints, a hint repeated in a row, column, or block has no solution
+        for k in range(0, 81):
+            r, c = k // 9, k % 9
+            b = (r // 3) * 3 + c // 3
+            if grid[k] == 0:
+                empty += [(k, r, c, b)]
+                continue
+            bit = 1 << grid[k]
+            if (rows[r] | cols[c] | blocks[b]) & bit:
+                return 0, None
+            rows[r] |= bit
+            cols[c] |= bit
+            blocks[b] |= bit
+
+        grid = list(grid)
+        found = []
+        bit_counts = Board.__bit_counts
+        nodes = [0]
+
+        def guess(remaining):
+
+            # every cell is filled in so we have found a solution
+            if not remaining:
+                found.append(list(grid))
+                return len(found) == limit
+
+            # too many guesses, so give up on the search
+            nodes[0] += 1
+            if max_nodes is not None and nodes[0] > max_nodes:
+                return True
+
+            # choose the empty cell with the fewest allowed numbers
+            best = 0
+            best_free = 0
+            best_count = 10
+            for index in range(0, len(remaining)):
+                k, r, c, b = remaining[index]
+                free = 0b1111111110 & ~(rows[r] | cols[c] | blocks[b])
+                count = bit_counts[free]
+                if count < best_count:
+                    best, best_free, best_count = index, free, count
+                    if count <= 1:
+                        break
+
+            # a cell with no allowed numbers means this branch has no solution
+            if best_count == 0:
+                return False
+
+            k, r, c, b = remaining[best]
+            rest = remaining[:best] + remaining[best + 1:]
+            bits = []
+            while best_free:
+                bit = best_free & -best_free
+                best_free ^= bit
+                bits += [bit]
+            if shuffle:
+                random.shuffle(bits)
+
+            for bit in bits:
+                grid[k] = bit.bit_length() - 1
+                rows[r] |= bit
+                cols[c] |= bit
+                blocks[b] |= bit
+                done = guess(rest)
+                rows[r] ^= bit
+                cols[c] ^= bit
+                blocks[b] ^= bit
+                if done:
+                    return True
+            grid[k] = 0
+            return False
+
+        guess(empty)
+        if max_nodes is not None and nodes[0] > max_nodes:
+            return None, None
+        return len(found), (found[0] if found else None)
+
+    def get_is_truncated(self):
+        """
+        Returns True if the deadline passed before hints stopped being removed, so the board has
+        more hints than it would have without a deadline, False otherwise
+        :return: self.__truncated -> boolean
+        """
+        return self.__truncated
+
+    def get_num_hints(self):
+        """
+        Returns the number of cells that are hints
+        :return: an integer in [0, 81]
+        """
+        return sum(1 for i in range(0, 9) for j in range(0, 9) if self.cells[i][j].get_is_hint())
+
+    def get_solution(self):
+        """
+        Returns the correct numbers of the board read row by row
+        :return: a string of 81 digits in [1, 9]
+        """
+        return "".join(str(self.cells[i][j].get_correct()) for i in range(0, 9) for j in range(0, 9))
+
+    def get_puzzle(self):
+        """
+        Returns the hints of the board read row by row, with a 0 for each cell that is not a hint
+        :return: a string of 81 digits in [0, 9]
+        """
+        return "".join(str(self.cells[i][j].get_correct()) if self.cells[i][j].get_is_hint() else "0"
+                       for i in range(0, 9) for j in range(0, 9))
@@ -1,4 +1,5 @@
 from Board import Board
+from History import History
 from functools import partial
 import tkinter as tk
 import random
@@ -6,10 +7,11 @@ import random
 
 class Game:
 
-    def __init__(self):
+    def __init__(self, max_history=1000):
         """
         Creates graphical user interface that displays a representation of the current
         state of the sudoku board and buttons in order to change the state of the board
+        :param max_history: a positive integer - the most guesses that can be undone
         """
 
         # instantiate necessary attributes
@@ -17,6 +19,7 @@ class Game:
         self.__solution_toggle = False
         self.__selection = 0
         self.__board = Board(random.randrange(0, 1000000))
+        self.__history = History(max_history)
         self.__buttons = []
         self.__selectors = []
 
@@ -25,7 +28,8 @@ class Game:
         window.title("Sudoku")
 
         # menu frame to hold the selection area for the selection buttons, new game button,
-        # random seed label, random seed entry, toggle highlight button, and toggle solution button
+        # random seed label, random seed entry, toggle highlight button, toggle solution button,
+        # undo button, and redo button
         menu = tk.Frame(
             master=window,
             height=500,
@@ -35,21 +39,25 @@ class Game:
         )
 
         # create the new game button, random seed label, random
-        # seed entry, toggle highlight button, and toggle solution button
+        # seed entry, toggle highlight button, toggle solution button, undo button, and redo button
         lbl_rand_seed = tk.Label(master=menu, text="Seed for board")
         self.__ent_rand_seed = tk.Entry(master=menu)
         btn_new_game = tk.Button(master=menu, text="New Game", command=lambda: self.__new_game(self.__ent_rand_seed.get()))
         btn_highlight = tk.Button(master=menu, text="Highlight Guesses", command=self.__toggle_highlight)
         btn_solution = tk.Button(master=menu, text="Toggle Solution", command=self.__toggle_solution)
+        self.__btn_undo = tk.Button(master=menu, text="Undo", command=self.__undo)
+        self.__btn_redo = tk.Button(master=menu, text="Redo", command=self.__redo)
 
         # position the new game button, random seed label, random
-        # seed entry, toggle highlight button, and toggle solution button
-        # above each other
+        # seed entry, toggle highlight button, toggle solution button, undo button,
+        # and redo button above each other
         btn_new_game.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
         lbl_rand_seed.grid(row=1, column=0, sticky="ew", padx=5)
         self.__ent_rand_seed.grid(row=2, column=0, sticky="ew", padx=5)
         btn_highlight.grid(row=3, column=0, sticky="ew", padx=5, pady=5)
         btn_solution.grid(row=4, column=0, sticky="ew", padx=5, pady=5)
+        self.__btn_undo.grid(row=5, column=0, sticky="ew", padx=5, pady=5)
+        self.__btn_redo.grid(row=6, column=0, sticky="ew", padx=5, pady=5)
 
         # create frame in the menu area to hold the selection buttons
         selection_area = tk.Frame(
@@ -89,7 +97,7 @@ class Game:
 
         # place selection board below other items in the menu area
         selection_area.grid(
-            row=5,
+            row=7,
             column=0,
             sticky="ew",
             padx=5,
@@ -136,6 +144,9 @@ class Game:
         # the difference between hints and their guesses
         self.__change_background_colors()
 
+        # no guesses have been made yet so there is nothing to undo or redo
+        self.__update_history_buttons()
+
         window.mainloop()
 
     def __new_game(self, rand_seed):
@@ -160,6 +171,10 @@ class Game:
         # clear entry
         self.__ent_rand_seed.delete(0, 'end')
 
+        # moves made on the old board cannot be undone on the new board
+        self.__history.clear()
+        self.__update_history_buttons()
+
         # update buttons to reflect new board
         self.__update_buttons()
 
@@ -284,8 +299,57 @@ class Game:
 
         # cell not a hint and I have chosen a selection number
         if not self.__board.cells[i][j].get_is_hint() and not self.__selection == 0:
+
+            # remember the move so it can be undone, ignoring guesses that change nothing
+            old_guess = self.__board.cells[i][j].get_guess()
+            if old_guess != self.__selection:
+                self.__history.record(i, j, old_guess, self.__selection)
+                self.__update_history_buttons()
             self.__board.cells[i][j].set_guess(self.__selection)
 
+        self.__update_button(i, j)
+
+    def __undo(self):
+        """
+        Takes back the most recent guess and updates the board button it was made in
+        """
+        move = self.__history.undo()
+
+        # there is a guess to take back
+        if move is not None:
+            i, j, old_guess, new_guess = move
+            self.__board.cells[i][j].set_guess(old_guess)
+            self.__update_button(i, j)
+            self.__update_history_buttons()
+
+    def __redo(self):
+        """
+        Makes the most recently undone guess again and updates the board button it was made in
+        """
+        move = self.__history.redo()
+
+        # there is a guess to make again
+        if move is not None:
+            i, j, old_guess, new_guess = move
+            self.__board.cells[i][j].set_guess(new_guess)
+            self.__update_button(i, j)
+            self.__update_history_buttons()
+
+    def __update_history_buttons(self):
+        """
+        Enables the undo and redo buttons only when there is a guess to undo or redo
+        """
+        self.__btn_undo['state'] = tk.NORMAL if self.__history.can_undo() else tk.DISABLED
+        self.__btn_redo['state'] = tk.NORMAL if self.__history.can_redo() else tk.DISABLED
+
+    def __update_button(self, i, j):
+        """
+        Updates the text and background color of the board button in the given row (i)
+        and the given column (j)
+        :param i: an integer in [0, 8]
+        :param j: an integer in [0, 8]
+        """
+
         # index of board button (corresponding to button in row i and column j) in list of buttons
         btn_index = i * 9 + j
 
@@ -0,0 +1,229 @@
+from Board import Board
+from LegacyBoard import LegacyBoard
+from functools import partial
+from multiprocessing import Pool
+import argparse
+import hashlib
+import importlib
+import os
+
+
+# golden hashes of the boards generated for seeds 0 to 999 before any engine changes, which pin
+# the seed to board contract even after Board itself is changed
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden_hashes.txt")
+
+
+def legacy_engine(seed):
+    """
+    Generates the board for the given seed with the frozen copy of the original Board in LegacyBoard,
+    which is the reference every candidate is compared against
+    :param seed: an integer
+    :return: a tuple (solution, puzzle) of 81 character strings in the same form as
+             Board.get_solution and Board.get_puzzle
+    """
+    board = LegacyBoard(seed)
+    solution = "".join(str(board.cells[i][j].get_correct()) for i in range(0, 9) for j in range(0, 9))
+    puzzle = "".join(str(board.cells[i][j].get_correct()) if board.cells[i][j].get_is_hint() else "0"
+                     for i in range(0, 9) for j in range(0, 9))
+    return solution, puzzle
+
+
+def board_engine(seed):
+    """
+    Generates the board for the given seed with the current Board implementation
+    :param seed: an integer
+    :return: a tuple (solution, puzzle) of 81 character strings as returned by
+             Board.get_solution and Board.get_puzzle
+    """
+    board = Board(seed)
+    return board.get_solution(), board.get_puzzle()
+
+
+def hint_mask(puzzle):
+    """
+    Returns which cells of a puzzle are hints
+    :param puzzle: a string of 81 digits in [0, 9]
+    :return: a string of 81 characters, 1 for each hint and 0 for each blank
+    """
+    return "".join("0" if ch == "0" else "1" for ch in puzzle)
+
+
+def board_hashes(solution, puzzle):
+    """
+    Returns hashes identifying a board by its solution and by its hint mask
+    :param solution: a string of 81 digits in [1, 9]
+    :param puzzle: a string of 81 digits in [0, 9]
+    :return: a tuple (solution_hash, mask_hash) of hexadecimal strings
+    """
+    return hashlib.sha256(solution.encode()).hexdigest(), hashlib.sha256(hint_mask(puzzle).encode()).hexdigest()
+
+
+def divergence(expected, actual):
+    """
+    Describes how two boards, or two pairs of board hashes, differ
+    :param expected: a tuple (solution, mask) of strings
+    :param actual: a tuple (solution, mask) of strings
+    :return: None if they are the same, otherwise "solution", "hints", or "solution and hints"
+    """
+    parts = [name for name, a, b in zip(["solution", "hints"], expected, actual) if a != b]
+    return " and ".join(parts) if parts else None
+
+
+def load_engine(name):
+    """
+    Finds the engine with the given name
+    :param name: a string "module:function" where the function takes a seed and returns a
+                 tuple (solution, puzzle) like legacy_engine
+    :return: the function
+    """
+    module, function = name.split(":")
+    return getattr(importlib.import_module(module), function)
+
+
+def _compare_seed(candidate, seed):
+    """
+    Generates the board for the given seed with both the legacy engine and the candidate engine
+    :param candidate: a function like legacy_engine
+    :param seed: an integer
+    :return: None if both engines produce the same solution and hints, otherwise what differs as
+             returned by divergence
+    """
+    solution, puzzle = legacy_engine(seed)
+    candidate_solution, candidate_puzzle = candidate(seed)
+    return divergence((solution, hint_mask(puzzle)), (candidate_solution, hint_mask(candidate_puzzle)))
+
+
+def _hash_seed(engine, seed):
+    """
+    Generates the board for the given seed with the given engine and hashes it
+    :param engine: a function like legacy_engine
+    :param seed: an integer
+    :return: the hashes of the board as returned by board_hashes
+    """
+    return board_hashes(*engine(seed))
+
+
+class Harness:
+    """
+    Harness class for checking that a candidate engine produces exactly the boards that the original
+    Board(seed) produced, storing the following info:
+    - the candidate engine, a function taking a seed and returning a tuple (solution, puzzle)
+    - the number of processes to spread the seeds over
+    Note: Engines are sent to other processes, so they must be functions defined at the top of a module
+    """
+
+    def __init__(self, candidate=board_engine, processes=None, chunksize=16):
+        """
+        Creates a Harness object with the candidate, processes, and chunksize attributes
+        :param candidate: a function like legacy_engine, the current Board by default
+        :param processes: the number of worker processes, or None for one per CPU
+        :param chunksize: the number of seeds handed to a worker at a time
+        """
+        self.__candidate = candidate
+        self.__processes = processes
+        self.__chunksize = chunksize
+
+    def compare(self, start, stop):
+        """
+        Compares the candidate engine against the legacy engine over the seeds in [start, stop)
+        :param start: an integer
+        :param stop: an integer
+        :return: a tuple (seed, difference) for the first seed where the engines differ, where difference
+                 is as returned by divergence, or None if they agree on every seed
+        """
+        seeds = range(start, stop)
+        with Pool(self.__processes) as pool:
+
+            # results come back in seed order, so the first mismatch is the first divergent seed
+            for seed, difference in zip(seeds, pool.imap(partial(_compare_seed, self.__candidate), seeds,
+                                                         self.__chunksize)):
+                if difference is not None:
+                    return seed, difference
+        return None
+
+    def record_golden(self, path, start, stop):
+        """
+        Writes the hashes of the candidate's board for each seed in [start, stop) to the given file,
+        one "seed solution_hash mask_hash" line per seed
+        :param path: a string
+        :param start: an integer
+        :param stop: an integer
+        """
+        seeds = range(start, stop)
+        with Pool(self.__processes) as pool, open(path, "w") as file:
+            for seed, hashes in zip(seeds, pool.imap(partial(_hash_seed, self.__candidate), seeds, self.__chunksize)):
+                file.write("%d %s %s\n" % ((seed,) + hashes))
+
+    def check_golden(self, path=GOLDEN_PATH):
+        """
+        Compares the candidate engine against the hashes in the given file written by record_golden
+        :param path: a string, the golden hashes committed with the repository by default
+        :return: a tuple (seed, difference) for the first seed where the candidate differs from the
+                 recorded hashes, where difference is as returned by divergence, or None if it matches
+                 every recorded hash
+        """
+        golden = {}
+        with open(path) as file:
+            for line in file:
+                seed, solution_hash, mask_hash = line.split()
+                golden[int(seed)] = (solution_hash, mask_hash)
+
+        seeds = sorted(golden)
+        with Pool(self.__processes) as pool:
+            hashes = pool.imap(partial(_hash_seed, self.__candidate), seeds, self.__chunksize)
+            for seed, actual in zip(seeds, hashes):
+                difference = divergence(golden[seed], actual)
+                if difference is not None:
+                    return seed, difference
+        return None
+
+
+def main():
+    """
+    Runs the harness from the command line, for example:
+        python Harness.py --candidate mymodule:engine compare 0 100000
+        python Harness.py record golden.txt 0 100000
+        python Harness.py --candidate mymodule:engine check golden.txt
+        python Harness.py check
+    """
+    parser = argparse.ArgumentParser(description="Check that an engine generates the same boards as the original "
+                                                 "Board(seed)")
+    parser.add_argument("--candidate", default="Harness:board_engine",
+                        help="engine to check, as module:function, the current Board by default")
+    parser.add_argument("--processes", type=int, default=None, help="number of worker processes")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compare = commands.add_parser("compare", help="compare the candidate against the frozen LegacyBoard")
+    compare.add_argument("start", type=int)
+    compare.add_argument("stop", type=int)
+
+    record = commands.add_parser("record", help="record golden hashes of the candidate")
+    record.add_argument("path")
+    record.add_argument("start", type=int)
+    record.add_argument("stop", type=int)
+
+    check = commands.add_parser("check", help="compare the candidate against recorded golden hashes")
+    check.add_argument("path", nargs="?", default=GOLDEN_PATH, help="golden hashes, the committed ones by default")
+
+    args = parser.parse_args()
+    harness = Harness(load_engine(args.candidate), args.processes)
+
+    if args.command == "record":
+        harness.record_golden(args.path, args.start, args.stop)
+        print("recorded seeds %d to %d in %s" % (args.start, args.stop - 1, args.path))
+        return
+
+    if args.command == "compare":
+        result = harness.compare(args.start, args.stop)
+    else:
+        result = harness.check_golden(args.path)
+
+    if result is None:
+        print("no divergence")
+    else:
+        print("first divergent seed: %d, different %s" % result)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from collections import deque
+
+
+class History:
+    """
+    History class for storing the guesses made on a board so they can be undone and redone including:
+    - a deque of moves that can be undone
+    - a deque of moves that can be redone
+    Note: A move is stored as a tuple (r, c, old_guess, new_guess) rather than a copy of the board,
+          so undoing and redoing are constant time, making a new move is amortized constant time,
+          and the memory used is bounded by the maximum length of the history
+    """
+
+    def __init__(self, max_length=1000):
+        """
+        Creates a History object with the undo and redo attributes
+        :param max_length: a positive integer - the most moves that are remembered, the oldest
+                           moves are forgotten once this is reached
+        """
+        self.__max_length = max_length
+        self.__undo = deque(maxlen=max_length)
+        self.__redo = deque(maxlen=max_length)
+
+    def record(self, r, c, old_guess, new_guess):
+        """
+        Remembers a guess made in the cell in the given row (r) and the given column (c)
+        Note: Making a new move starts a new branch, so the moves that could be redone are forgotten
+        :param r: an integer in [0, 8]
+        :param c: an integer in [0, 8]
+        :param old_guess: None or an integer in [1, 9] - the guess in the cell before the move
+        :param new_guess: None or an integer in [1, 9] - the guess in the cell after the move
+        """
+        self.__undo.append((r, c, old_guess, new_guess))
+
+        # each move can only be forgotten once after it is recorded, so branching is amortized O(1)
+        self.__redo.clear()
+
+    def undo(self):
+        """
+        Takes back the most recent move
+        :return: the move (r, c, old_guess, new_guess) that was taken back, or None if there
+                 are no moves to undo
+        """
+        if not self.__undo:
+            return None
+        move = self.__undo.pop()
+        self.__redo.append(move)
+        return move
+
+    def redo(self):
+        """
+        Makes the most recently undone move again
+        :return: the move (r, c, old_guess, new_guess) that was made again, or None if there
+                 are no moves to redo
+        """
+        if not self.__redo:
+            return None
+        move = self.__redo.pop()
+        self.__undo.append(move)
+        return move
+
+    def can_undo(self):
+        """
+        Returns True if there is a move to undo, False otherwise
+        :return: boolean
+        """
+        return len(self.__undo) > 0
+
+    def can_redo(self):
+        """
+        Returns True if there is a move to redo, False otherwise
+        :return: boolean
+        """
+        return len(self.__redo) > 0
+
+    def clear(self):
+        """
+        Forgets all moves, used when a new board is started
+        """
+        self.__undo = deque(maxlen=self.__max_length)
+        self.__redo = deque(maxlen=self.__max_length)
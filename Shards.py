@@ -0,0 +1,337 @@
+from Harness import board_engine
+import argparse
+import bisect
+import os
+import socket
+import sqlite3
+import time
+import uuid
+
+
+def shard_range(shard):
+    """
+    Returns the seeds covered by a shard
+    :param shard: a shard name "<start>-<stop>"
+    :return: a tuple (start, stop) of integers
+    """
+    start, stop = shard.split("-")
+    return int(start), int(stop)
+
+
+class Coordinator:
+    """
+    Coordinator class for splitting a range of seeds into shards that workers generate boards for,
+    using a directory on a shared filesystem as the work queue. The directory holds:
+    - pending/ with a file for each shard no worker has claimed
+    - running/ with a file for each shard a worker is generating, holding the id of that worker and
+      touched by it after every board so that its modification time shows the worker is still alive
+    - done/ with a file for each finished shard
+    - output/ with a checkpoint file for each shard, one "seed solution puzzle" line per generated board
+    Note: A shard is named "<start>-<stop>" and covers the seeds in [start, stop)
+    """
+
+    def __init__(self, directory):
+        """
+        Creates a Coordinator object for the work queue in the given directory
+        :param directory: a string
+        """
+        self.__directory = directory
+
+    def split(self, start, stop, shard_size):
+        """
+        Queues shards covering the seeds in [start, stop), skipping shards that are already queued
+        Note: Raises a ValueError without queuing anything if a new shard overlaps an existing shard
+              that is not the same, since its seeds would be generated twice
+        :param start: an integer
+        :param stop: an integer
+        :param shard_size: a positive integer - the number of seeds in each shard
+        """
+        if shard_size <= 0:
+            raise ValueError("shard size must be positive, got %d" % shard_size)
+        if start >= stop:
+            raise ValueError("start must be less than stop, got %d to %d" % (start, stop))
+
+        for state in ["pending", "running", "done", "output"]:
+            os.makedirs(os.path.join(self.__directory, state), exist_ok=True)
+
+        # list the existing shards once, ordered by their first seed so overlaps can be found by bisection
+        existing = set(self.__shards("pending") + self.__shards("running") + self.__shards("done"))
+        ranges = sorted(shard_range(shard) for shard in existing)
+        starts = [shard_start for shard_start, shard_stop in ranges]
+
+        new = []
+        for shard_start in range(start, stop, shard_size):
+            shard_stop = min(shard_start + shard_size, stop)
+            shard = "%d-%d" % (shard_start, shard_stop)
+
+            # a shard that is already pending, running, or done is left where it is
+            if shard in existing:
+                continue
+
+            # existing shards do not overlap each other, so only the last one starting before the new
+            # shard ends can reach into it
+            index = bisect.bisect_left(starts, shard_stop) - 1
+            if index >= 0 and ranges[index][1] > shard_start:
+                raise ValueError("shard %s overlaps existing shard %d-%d" % ((shard,) + ranges[index]))
+            new += [shard]
+
+        for shard in new:
+            open(os.path.join(self.__directory, "pending", shard), "w").close()
+
+    def __shards(self, state):
+        """
+        Returns the shards in the given state ordered by their first seed
+        :param state: "pending", "running", or "done"
+        :return: a list of shard names
+        """
+        return sorted(os.listdir(os.path.join(self.__directory, state)), key=shard_range)
+
+    def status(self):
+        """
+        Returns the number of shards in each state
+        :return: a dictionary from "pending", "running", and "done" to integers
+        """
+        return {state: len(self.__shards(state)) for state in ["pending", "running", "done"]}
+
+    def requeue_stale(self, timeout):
+        """
+        Moves running shards whose worker has not touched them for the given time back to pending,
+        so that the shards of crashed workers are picked up again and resumed from their checkpoints
+        Note: The timeout should be well above the time taken to generate one board, a worker that
+              loses its shard this way notices before its next write and stops working on it
+        :param timeout: a number of seconds
+        :return: the list of shards that were requeued
+        """
+        requeued = []
+        for shard in self.__shards("running"):
+            running = os.path.join(self.__directory, "running", shard)
+            try:
+                if time.time() - os.path.getmtime(running) > timeout:
+                    os.rename(running, os.path.join(self.__directory, "pending", shard))
+                    requeued += [shard]
+
+            # the worker finished the shard while it was being checked
+            except FileNotFoundError:
+                continue
+        return requeued
+
+    def merge(self, path):
+        """
+        Writes the boards of all finished shards into a single SQLite database indexed by seed
+        Note: Merging again after more shards finish adds their boards, existing seeds are replaced.
+              A seed may appear more than once in a shard if two workers both generated it after a requeue,
+              which is fine as long as the boards are the same. Raises a ValueError without writing anything
+              if a finished shard is missing a seed, has different boards for the same seed, or has a line
+              that is not a board for one of its seeds
+        :param path: a string
+        :return: the number of boards written
+        """
+        count = 0
+        store = sqlite3.connect(path)
+        with store:
+            store.execute("CREATE TABLE IF NOT EXISTS boards (seed INTEGER PRIMARY KEY, solution TEXT, puzzle TEXT)")
+            for shard in self.__shards("done"):
+                start, stop = shard_range(shard)
+                boards = {}
+                with open(os.path.join(self.__directory, "output", shard)) as file:
+                    for line in file:
+                        row = line.split()
+
+                        # a partly written line or a seed from another shard means the shard cannot be trusted
+                        if len(row) != 3 or not row[0].isdigit() or not start <= int(row[0]) < stop:
+                            raise ValueError("shard %s has a line that is not a board for one of its seeds: %r"
+                                             % (shard, line.strip()))
+
+                        # the same seed generated twice must have produced the same board
+                        seed, board = int(row[0]), (row[1], row[2])
+                        if boards.setdefault(seed, board) != board:
+                            raise ValueError("shard %s has different boards for seed %d" % (shard, seed))
+
+                if len(boards) != stop - start:
+                    missing = min(set(range(start, stop)) - set(boards))
+                    raise ValueError("shard %s is missing the board for seed %d" % (shard, missing))
+                store.executemany("INSERT OR REPLACE INTO boards VALUES (?, ?, ?)",
+                                  [(seed,) + boards[seed] for seed in range(start, stop)])
+                count += len(boards)
+        store.close()
+        return count
+
+
+class Worker:
+    """
+    Worker class for generating the boards of the shards queued by a Coordinator
+    Note: Any number of workers on any number of machines can share the same directory, a shard is claimed
+          by atomically moving its file from pending/ to running/, so only one worker can claim it, and the
+          worker then writes its id into the file so it can tell if the shard was requeued and claimed by another
+    """
+
+    def __init__(self, directory, engine=board_engine, worker_id=None):
+        """
+        Creates a Worker object for the work queue in the given directory
+        :param directory: a string
+        :param engine: a function taking a seed and returning a tuple (solution, puzzle) like
+                       Harness.board_engine, the current Board by default
+        :param worker_id: a string unique to this worker, or None to make one from the host name and process id
+        """
+        self.__directory = directory
+        self.__engine = engine
+        if worker_id is None:
+            worker_id = "%s-%d-%s" % (socket.gethostname(), os.getpid(), uuid.uuid4().hex[:8])
+        self.__id = worker_id
+
+    def __claim(self):
+        """
+        Claims the pending shard with the lowest first seed
+        :return: the name of the claimed shard, or None if no shards are pending
+        """
+        for shard in sorted(os.listdir(os.path.join(self.__directory, "pending")), key=shard_range):
+            running = os.path.join(self.__directory, "running", shard)
+            try:
+                os.rename(os.path.join(self.__directory, "pending", shard), running)
+
+                # mark the shard as ours, opening without creating in case it was requeued in the meantime,
+                # and touch it since renaming keeps the old modification time
+                with open(running, "r+") as file:
+                    file.truncate()
+                    file.write(self.__id)
+                os.utime(running)
+                return shard
+
+            # another worker claimed the shard first, or it was requeued before it was marked
+            except FileNotFoundError:
+                continue
+        return None
+
+    def __owns(self, shard):
+        """
+        Checks that the given shard is still running and was last claimed by this worker
+        :param shard: a shard name
+        :return: True if this worker owns the shard, False otherwise
+        """
+        try:
+            with open(os.path.join(self.__directory, "running", shard)) as file:
+                return file.read() == self.__id
+        except FileNotFoundError:
+            return False
+
+    def __resume_point(self, checkpoint, start):
+        """
+        Finds the first seed of a shard that has not been generated yet, removing any line
+        that was only partly written when a worker crashed
+        :param checkpoint: the path of the shard's checkpoint file
+        :param start: the first seed of the shard
+        :return: the first seed to generate
+        """
+        if not os.path.exists(checkpoint):
+            return start
+
+        with open(checkpoint, "rb+") as file:
+            data = file.read()
+            complete = data[:data.rfind(b"\n") + 1]
+            if len(complete) != len(data):
+                file.truncate(len(complete))
+
+        lines = complete.split(b"\n")[:-1]
+        return int(lines[-1].split()[0]) + 1 if lines else start
+
+    def run_shard(self, shard):
+        """
+        Generates the boards of a claimed shard, resuming from its checkpoint, and marks it done
+        Note: Stops without marking the shard done if it was requeued, leaving it to the worker that owns it now
+        :param shard: the name of a shard in running/
+        :return: True if the shard was finished, False if this worker no longer owns it
+        """
+        start, stop = shard_range(shard)
+        checkpoint = os.path.join(self.__directory, "output", shard)
+        running = os.path.join(self.__directory, "running", shard)
+        if not self.__owns(shard):
+            return False
+
+        with open(checkpoint, "a") as file:
+            for seed in range(self.__resume_point(checkpoint, start), stop):
+                solution, puzzle = self.__engine(seed)
+                if not self.__owns(shard):
+                    return False
+                file.write("%d %s %s\n" % (seed, solution, puzzle))
+
+                # make sure the board is on disk before moving on so a crash loses at most one seed
+                file.flush()
+                os.fsync(file.fileno())
+
+                # show the coordinator this worker is still alive
+                try:
+                    os.utime(running)
+                except FileNotFoundError:
+                    return False
+
+        if not self.__owns(shard):
+            return False
+        try:
+            os.rename(running, os.path.join(self.__directory, "done", shard))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def run(self):
+        """
+        Claims and generates shards until none are pending
+        :return: the number of shards finished by this worker
+        """
+        count = 0
+        shard = self.__claim()
+        while shard is not None:
+            if self.run_shard(shard):
+                count += 1
+            shard = self.__claim()
+        return count
+
+
+def main():
+    """
+    Runs the coordinator or a worker from the command line, for example:
+        python Shards.py work_dir split 0 1000000 10000
+        python Shards.py work_dir work
+        python Shards.py work_dir requeue 600
+        python Shards.py work_dir merge boards.db
+    """
+    parser = argparse.ArgumentParser(description="Generate boards for a range of seeds across many workers")
+    parser.add_argument("directory", help="work queue directory shared by the coordinator and workers")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    split = commands.add_parser("split", help="queue shards covering a range of seeds")
+    split.add_argument("start", type=int)
+    split.add_argument("stop", type=int)
+    split.add_argument("shard_size", type=int)
+
+    commands.add_parser("work", help="generate queued shards until none are pending")
+    commands.add_parser("status", help="show the number of pending, running, and done shards")
+
+    requeue = commands.add_parser("requeue", help="requeue running shards whose worker stopped making progress")
+    requeue.add_argument("timeout", type=float, help="seconds without progress")
+
+    merge = commands.add_parser("merge", help="merge finished shards into a SQLite database")
+    merge.add_argument("path")
+
+    args = parser.parse_args()
+    coordinator = Coordinator(args.directory)
+
+    try:
+        if args.command == "split":
+            coordinator.split(args.start, args.stop, args.shard_size)
+            print(coordinator.status())
+        elif args.command == "work":
+            print("generated %d shards" % Worker(args.directory).run())
+        elif args.command == "status":
+            print(coordinator.status())
+        elif args.command == "requeue":
+            print("requeued %s" % coordinator.requeue_stale(args.timeout))
+        else:
+            print("merged %d boards into %s" % (coordinator.merge(args.path), args.path))
+
+    # a bad range, overlapping shards, or an incomplete finished shard
+    except ValueError as error:
+        raise SystemExit("error: %s" % error)
+
+
+if __name__ == "__main__":
+    main()